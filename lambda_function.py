@@ -1,76 +1,148 @@
 import json
 import logging
 import os
-import uuid
 from datetime import datetime
 from typing import Any, Dict, Optional
 
+import orjson
+
 # Configure simple logging for Lambda
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
+# Level is fixed above, so resolve the INFO check once per container. The value
+# is frozen at import: e.g. a logging.disable(logging.INFO) in effect before
+# import keeps INFO logs off for the container's lifetime, even after a later
+# logging.disable(logging.NOTSET).
+_LOG_INFO = logger.isEnabledFor(logging.INFO)
+
 # Version information
 __version__ = "1.1.0"
 
+# Static response scaffolding; handed out as copies so callers cannot mutate it
+_HEADERS = {
+    "Content-Type": "application/json",
+    "Access-Control-Allow-Origin": "*"
+}
+_DEFAULT_FN_NAME = "lambda-test-python"
+
+# Bound once to skip the class attribute lookup on every call
+_now = datetime.now
+
+# Greeting body shape; per-call fields are filled in on a copy
+_GREETING_TEMPLATE = {
+    "message": None,
+    "timestamp": None,
+    "version": __version__,
+    "function_name": _DEFAULT_FN_NAME,
+    "request_id": None,
+    "environment": "unknown",
+    "source": "unknown"
+}
+
+
+def _json_default(obj: Any) -> str:
+    """Fallback encoder hook matching orjson's native datetime output"""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _dumps(obj: Any) -> bytes:
+    """
+    Encode compact JSON with orjson, falling back to stdlib json for values
+    orjson rejects (e.g. integers outside the 64-bit range). Note that orjson
+    encodes NaN/Infinity as null rather than raising.
+    """
+    try:
+        return orjson.dumps(obj)
+    except orjson.JSONEncodeError:
+        return json.dumps(obj, separators=(",", ":"), default=_json_default).encode()
+
+
+def _rid() -> str:
+    """Random hex id used when no Lambda context is available"""
+    return os.urandom(16).hex()
+
+
+class _LazyJSON:
+    """Defer JSON encoding of a log argument until the record is formatted"""
+
+    __slots__ = ("obj",)
+
+    def __init__(self, obj: Any) -> None:
+        self.obj = obj
+
+    def __str__(self) -> str:
+        return _dumps(self.obj).decode()
+
 
 def lambda_handler(event: Dict[str, Any], context: Optional[Any]) -> Dict[str, Any]:
     """
     Simple Lambda function for testing deployment workflows
     """
-    request_id = context.aws_request_id if context else str(uuid.uuid4())
+    request_id = context.aws_request_id if context else _rid()
     
-    # Log the incoming event
-    logger.info(f"Lambda invocation started - Request ID: {request_id}")
-    logger.info(f"Received event: {json.dumps(event)}")
+    # Log the incoming event as a single record (one write per invocation start),
+    # skipping the encode entirely when INFO is filtered
+    if _LOG_INFO:
+        logger.info(
+            "Lambda invocation started - Request ID: %s, Received event: %s",
+            request_id,
+            _LazyJSON(event),
+        )
 
     try:
         # Extract name from event or use default
         name = event.get("name", "World")
         
-        # Get current timestamp
-        current_time = datetime.now().isoformat()
+        # Get current timestamp (orjson serializes datetime natively)
+        current_time = _now()
         
-        # Create response body
-        response_body = {
-            "message": f"Hello, {name}!",
-            "timestamp": current_time,
-            "version": __version__,
-            "function_name": context.function_name if context else "lambda-test-python",
-            "request_id": request_id,
-            "environment": event.get("environment", "unknown"),
-            "source": event.get("source", "unknown")
-        }
+        # Create response body from the precomputed template
+        response_body = _GREETING_TEMPLATE.copy()
+        response_body["message"] = f"Hello, {name}!"
+        response_body["timestamp"] = current_time
+        response_body["request_id"] = request_id
+        if context:
+            response_body["function_name"] = context.function_name
+        if "environment" in event:
+            response_body["environment"] = event["environment"]
+        if "source" in event:
+            response_body["source"] = event["source"]
+
+        # Encode the body once; the log line only reports its size
+        body_bytes = _dumps(response_body)
 
         # Create response
         response = {
             "statusCode": 200,
-            "headers": {
-                "Content-Type": "application/json",
-                "Access-Control-Allow-Origin": "*"
-            },
-            "body": json.dumps(response_body, indent=2)
+            "headers": _HEADERS.copy(),
+            "body": body_bytes.decode()
         }
 
-        logger.info(f"Lambda invocation completed successfully - Request ID: {request_id}")
+        if _LOG_INFO:
+            logger.info(
+                "Lambda invocation completed successfully - Request ID: %s, Body size: %d bytes",
+                request_id,
+                len(body_bytes),
+            )
         
         return response
 
     except Exception as e:
-        logger.error(f"Lambda invocation failed - Request ID: {request_id}, Error: {str(e)}")
+        logger.error("Lambda invocation failed - Request ID: %s, Error: %s", request_id, e)
         
         # Return error response
         error_response = {
             "statusCode": 500,
-            "headers": {
-                "Content-Type": "application/json",
-                "Access-Control-Allow-Origin": "*"
-            },
-            "body": json.dumps({
+            "headers": _HEADERS.copy(),
+            "body": _dumps({
                 "error": "Internal server error",
                 "message": str(e),
                 "request_id": request_id,
                 "version": __version__
-            })
+            }).decode()
         }
         
         return error_response
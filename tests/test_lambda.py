@@ -1,5 +1,6 @@
 import json
 import unittest
+from datetime import datetime
 from unittest.mock import Mock
 from lambda_function import lambda_handler
 
@@ -50,6 +51,121 @@ class TestLambdaFunction(unittest.TestCase):
         self.assertIn("timestamp", body)
         self.assertIn("version", body)
 
+    def test_full_event_body(self):
+        """Test full body contents and key order for a complete event"""
+        event = {
+            "name": "Test",
+            "source": "GitHub Actions",
+            "environment": "dev",
+            "extra": "ignored"
+        }
+        context = Mock()
+        context.function_name = "my-function"
+        context.aws_request_id = "test-request-999"
+
+        response = lambda_handler(event, context)
+
+        self.assertEqual(response["statusCode"], 200)
+
+        body = json.loads(response["body"])
+        timestamp = body.pop("timestamp")
+        datetime.fromisoformat(timestamp)
+        self.assertEqual(
+            list(body.items()),
+            [
+                ("message", "Hello, Test!"),
+                ("version", "1.1.0"),
+                ("function_name", "my-function"),
+                ("request_id", "test-request-999"),
+                ("environment", "dev"),
+                ("source", "GitHub Actions"),
+            ],
+        )
+
+    def test_explicit_none_fields_preserved(self):
+        """Test explicit None environment/source are echoed, not defaulted"""
+        event = {"environment": None, "source": None}
+
+        response = lambda_handler(event, None)
+
+        body = json.loads(response["body"])
+        self.assertIsNone(body["environment"])
+        self.assertIsNone(body["source"])
+        self.assertEqual(body["function_name"], "lambda-test-python")
+
+    def test_body_is_compact_json_with_iso_timestamp(self):
+        """Test body is compact JSON and timestamp round-trips as ISO-8601"""
+        response = lambda_handler({}, None)
+
+        self.assertNotIn("\n", response["body"])
+        self.assertNotIn(": ", response["body"])
+
+        body = json.loads(response["body"])
+        timestamp = datetime.fromisoformat(body["timestamp"])
+        self.assertEqual(timestamp.isoformat(), body["timestamp"])
+
+    def test_large_integer_in_event(self):
+        """Test integers beyond 64 bits fall back to stdlib encoding"""
+        event = {"environment": 2**70}
+
+        response = lambda_handler(event, None)
+
+        self.assertEqual(response["statusCode"], 200)
+
+        body = json.loads(response["body"])
+        self.assertEqual(body["environment"], 2**70)
+        datetime.fromisoformat(body["timestamp"])
+
+    def test_nan_in_event_encoded_as_null(self):
+        """Test NaN values are encoded as JSON null"""
+        event = {"source": float("nan")}
+
+        response = lambda_handler(event, None)
+
+        self.assertEqual(response["statusCode"], 200)
+
+        body = json.loads(response["body"])
+        self.assertIsNone(body["source"])
+
+    def test_invocation_logging(self):
+        """Test start line carries the event JSON and completion line the body size"""
+        event = {"name": "Alice", "source": "test"}
+        context = Mock()
+        context.function_name = "lambda-test-python"
+        context.aws_request_id = "test-request-789"
+
+        with self.assertLogs(level="INFO") as logs:
+            response = lambda_handler(event, context)
+
+        self.assertEqual(len(logs.output), 2)
+        self.assertIn(
+            "Lambda invocation started - Request ID: test-request-789, "
+            'Received event: {"name":"Alice","source":"test"}',
+            logs.output[0],
+        )
+        self.assertIn(
+            "Lambda invocation completed successfully - Request ID: test-request-789, "
+            f"Body size: {len(response['body'].encode())} bytes",
+            logs.output[1],
+        )
+
+    def test_fallback_request_id_format(self):
+        """Test request id without a context is 32 lowercase hex characters"""
+        response = lambda_handler({}, None)
+
+        request_id = json.loads(response["body"])["request_id"]
+        self.assertRegex(request_id, r"\A[0-9a-f]{32}\Z")
+
+    def test_headers_not_shared_between_responses(self):
+        """Test mutating one response's headers does not leak into the next"""
+        first = lambda_handler({"name": "x"}, None)
+        first["headers"]["X-Custom"] = "y"
+
+        second = lambda_handler({"name": "x"}, None)
+
+        self.assertNotIn("X-Custom", second["headers"])
+        self.assertEqual(second["headers"]["Content-Type"], "application/json")
+
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file